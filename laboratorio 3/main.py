@@ -1,12 +1,15 @@
+import sys
+
 from utils import greet_user, read_csv_to_dict
 from math_ops import factorial, fibonacci
 
 
 def main():
-    name = input("Nombre: ")
+    # Argumentos opcionales: `python main.py NOMBRE NUMERO` evita pedirlos por teclado
+    name = sys.argv[1] if len(sys.argv) > 1 else input("Nombre: ")
     greet_user(name)
 
-    number = input("Numero: ")
+    number = sys.argv[2] if len(sys.argv) > 2 else input("Numero: ")
 
     # No hay validación de entrada
     number = int(number)
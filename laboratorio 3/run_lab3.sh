@@ -18,11 +18,8 @@ if [ $# -ge 2 ]; then
 fi
 
 if [ -n "$NAME" ] && [ -n "$NUMBER" ]; then
-  # Ejecuta pasando las entradas por heredoc para evitar interacción
-  python main.py <<EOF
-$NAME
-$NUMBER
-EOF
+  # Ejecuta pasando las entradas como argumentos para evitar interacción
+  python main.py "$NAME" "$NUMBER"
 else
   # Ejecuta interactivamente
   python main.py
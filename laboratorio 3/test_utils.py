@@ -66,3 +66,119 @@ def test_allow_duplicates(tmp_path):
     res = read_csv_to_dict(str(p), key="id", allow_duplicates=True)
     assert isinstance(res["1"], list)
     assert len(res["1"]) == 2
+
+
+def test_missing_filter_column_raises():
+    with pytest.raises(KeyError):
+        read_csv_to_dict(
+            os.path.join(HERE, "sample.csv"),
+            filter_column="nonexistent",
+            filter_value="x",
+        )
+
+
+def test_columnar_layout():
+    res = read_csv_to_dict(
+        os.path.join(HERE, "sample.csv"),
+        layout="columnar",
+        filter_column="name",
+        filter_value="Juan",
+    )
+    assert res == {"id": ["2"], "name": ["Juan"], "age": ["25"]}
+
+
+def test_columnar_layout_rejects_key():
+    with pytest.raises(ValueError):
+        read_csv_to_dict(os.path.join(HERE, "sample.csv"), key="id", layout="columnar")
+
+
+def test_keyed_filtered():
+    res = read_csv_to_dict(
+        os.path.join(HERE, "sample.csv"),
+        key="id",
+        filter_column="age",
+        filter_value="25",
+    )
+    assert list(res) == ["2"]
+    assert res["2"]["name"] == "Juan"
+
+
+def test_namedtuple_rows():
+    res = read_csv_to_dict(os.path.join(HERE, "sample.csv"), row_type="namedtuple")
+    assert res[0].name == "Ana"
+    assert tuple(res[1]) == ("2", "Juan", "25")
+
+
+def test_dataclass_rows_keyed_stream():
+    it = read_csv_to_dict(
+        os.path.join(HERE, "sample.csv"), key="id", stream=True, row_type="dataclass"
+    )
+    k, row = next(it)
+    assert k == "1"
+    assert row.name == "Ana"
+    assert not hasattr(row, "__dict__")
+
+
+def test_columns_projection_keyed():
+    res = read_csv_to_dict(
+        os.path.join(HERE, "sample.csv"),
+        key="id",
+        columns=["name"],
+        filter_column="age",
+        filter_value="30",
+    )
+    assert res == {"1": {"name": "Ana", "id": "1"}}
+
+
+def test_columns_missing_raises():
+    with pytest.raises(KeyError):
+        read_csv_to_dict(os.path.join(HERE, "sample.csv"), columns=["nope"])
+
+
+def test_blank_and_short_rows(tmp_path):
+    p = tmp_path / "ragged.csv"
+    p.write_text("id,name,age\n1,A,30\n\n2,B\n3,,\n")
+    expected = [
+        {"id": "1", "name": "A", "age": "30"},
+        {"id": "2", "name": "B", "age": None},
+        {"id": "3", "name": "", "age": ""},
+    ]
+    assert read_csv_to_dict(str(p)) == expected
+    assert list(read_csv_to_dict(str(p), stream=True)) == expected
+    assert read_csv_to_dict(str(p), key="id")["2"]["age"] is None
+
+
+def test_filter_empty_value(tmp_path):
+    p = tmp_path / "empty.csv"
+    p.write_text("id,name\n1,\n2,B\n")
+    res = read_csv_to_dict(str(p), filter_column="name", filter_value="")
+    assert res == [{"id": "1", "name": ""}]
+
+
+def test_duplicate_header_last_wins(tmp_path):
+    p = tmp_path / "dup_header.csv"
+    p.write_text("id,id,x\n1,2,3\n")
+    assert read_csv_to_dict(str(p)) == [{"id": "2", "x": "3"}]
+    assert read_csv_to_dict(str(p), columns=["id"]) == [{"id": "2"}]
+
+
+def test_row_objects_rename_invalid_headers(tmp_path):
+    p = tmp_path / "names.csv"
+    p.write_text("\ufefffirst name,class,id,id\nAna,A,1,2\n", encoding="utf-8")
+    for row_type in ("namedtuple", "dataclass"):
+        (row,) = read_csv_to_dict(str(p), row_type=row_type)
+        assert (row._0, row._1, row.id, row._3) == ("Ana", "A", "1", "2")
+
+
+def test_long_rows_match_dictreader(tmp_path):
+    p = tmp_path / "long.csv"
+    p.write_text("id,name\n1,A,x,y\n2,B\n")
+    expected = [{"id": "1", "name": "A", None: ["x", "y"]}, {"id": "2", "name": "B"}]
+    assert read_csv_to_dict(str(p)) == expected
+    assert list(read_csv_to_dict(str(p), stream=True)) == expected
+    assert read_csv_to_dict(str(p), key="id")["1"][None] == ["x", "y"]
+    assert read_csv_to_dict(str(p), columns=["name"]) == [{"name": "A"}, {"name": "B"}]
+    with pytest.raises(ValueError):
+        read_csv_to_dict(str(p), row_type="namedtuple")
+    with pytest.raises(ValueError):
+        read_csv_to_dict(str(p), layout="columnar")
@@ -1,10 +1,101 @@
 from typing import Dict, List, Iterator, Union, Optional, Any, Tuple
+from collections import namedtuple
+from dataclasses import make_dataclass
 import csv
+import keyword
 import os
 
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - dependencia opcional
+    pl = None
+
 
 def greet_user(name: str) -> None:
-    print("Hola " + name)
+    print(f"Hola {name}")
+
+
+ROW_TYPES = ("dict", "namedtuple", "dataclass")
+
+
+def _field_names(fieldnames: List[str]) -> List[str]:
+    """Nombres de atributo válidos para la cabecera, con la regla de `namedtuple`.
+
+    Igual que `namedtuple(..., rename=True)`: los nombres que no son
+    identificadores, son palabras reservadas, empiezan por `_` o están repetidos
+    pasan a `_<posición>` (p.ej. `"first name"` -> `_0`).
+    """
+    names: List[str] = []
+    seen = set()
+    for i, name in enumerate(fieldnames):
+        if (
+            not name.isidentifier()
+            or keyword.iskeyword(name)
+            or name.startswith("_")
+            or name in seen
+        ):
+            name = f"_{i}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def _row_class(fieldnames: List[str], row_type: str) -> Optional[type]:
+    """Crea (una vez por cabecera) la clase de fila para `row_type`; None para dict.
+
+    Ambos tipos usan los mismos nombres de atributo (ver `_field_names`).
+    """
+    if row_type == "namedtuple":
+        return namedtuple("Row", _field_names(fieldnames), rename=True)
+    if row_type == "dataclass":
+        return make_dataclass("Row", _field_names(fieldnames), frozen=True, slots=True)
+    return None
+
+
+def _pad_row(values: List[Any], width: int) -> List[Any]:
+    """Completa con None una fila corta de `csv.reader`; los campos de más se dejan."""
+    if len(values) >= width:
+        return values
+    return values + [None] * (width - len(values))
+
+
+def _fit_row(values: List[Any], width: int) -> List[Any]:
+    """Ajusta una fila de `csv.reader` al ancho de la cabecera (faltantes -> None).
+
+    Los campos de más sólo caben en un dict (bajo la clave None, ver `_dict_row`);
+    para filas como objeto o columnas se lanza ValueError en lugar de perderlos.
+    """
+    if len(values) > width:
+        raise ValueError(f"Fila con {len(values)} campos y la cabecera tiene {width}")
+    return _pad_row(values, width)
+
+
+def _dict_row(header: List[str], values: List[Any]) -> Dict[Any, Any]:
+    """Fila como dict con la semántica de `csv.DictReader`.
+
+    Faltantes -> None y campos de más en una lista bajo la clave None.
+    """
+    row: Dict[Any, Any] = dict(zip(header, values))
+    if len(values) > len(header):
+        row[None] = values[len(header) :]
+    elif len(values) < len(header):
+        for name in header[len(values) :]:
+            row[name] = None
+    return row
+
+
+def _compile_row_filter(header: List[str], column: str, value: str) -> Any:
+    """Devuelve un predicado `row -> bool` con la posición de `column` ya resuelta.
+
+    Especializa el filtro una sola vez por llamada: en el bucle sólo queda una
+    indexación de lista y una comparación, sin búsquedas en diccionarios.
+    """
+    idx = header.index(column)
+
+    def _pred(row: List[str]) -> bool:
+        return len(row) > idx and row[idx] == value
+
+    return _pred
 
 
 def read_csv_to_dict(
@@ -16,8 +107,12 @@ def read_csv_to_dict(
     stream: bool = False,
     filter_column: Optional[str] = None,
     filter_value: Optional[str] = None,
+    layout: str = "rows",
+    row_type: str = "dict",
+    columns: Optional[List[str]] = None,
 ) -> Union[
     List[Dict[str, str]],
+    Dict[str, List[str]],
     Dict[str, Union[Dict[str, str], List[Dict[str, str]]]],
     Iterator[Dict[str, str]],
     Iterator[Tuple[str, Dict[str, str]]],
@@ -29,12 +124,22 @@ def read_csv_to_dict(
     - Maneja explícitamente excepciones de archivo y CSV.
     - Opción `stream=True` para obtener un iterador que no carga todo en memoria.
     - Opción `allow_duplicates=True` para agrupar filas que comparten la misma clave.
+    - Si `polars` está instalado, la lectura sin streaming usa `pl.read_csv` (parser
+      multihilo en Rust) y el filtrado se hace con `df.filter`; si no, o si el CSV
+      tiene filas irregulares (en blanco, cortas o largas) o cabeceras repetidas,
+      se usa `csv`, de modo que el resultado es el mismo con o sin `polars`.
+      En streaming se usa siempre `csv`, que lee fila a fila con memoria acotada.
 
     Comportamiento:
     - Si `key` es None y `stream` es False: devuelve `List[Dict[str,str]]`.
     - Si `key` es None y `stream` es True: devuelve `Iterator[Dict[str,str]]`.
     - Si `key` es proporcionado y `stream` es False: devuelve `Dict[key->row]` (o `key->List[row]` si `allow_duplicates`).
     - Si `key` es proporcionado y `stream` es True: devuelve `Iterator[(key_value, row)]`.
+    - Si `layout="columnar"`: devuelve `Dict[columna->List[valor]]` (no admite `key`
+      ni `stream`).
+    - Con `row_type="namedtuple"` o `"dataclass"` (congelada, con `__slots__`) cada
+      fila es un objeto ligero en lugar de un dict; las estructuras de retorno son
+      las mismas.
 
     Args:
         path: Ruta al CSV.
@@ -46,6 +151,16 @@ def read_csv_to_dict(
         filter_column: Si se proporciona junto con `filter_value`, sólo se devuelven filas
             cuyo valor en `filter_column` sea igual a `filter_value`.
         filter_value: Valor a filtrar en `filter_column`.
+        layout: `"rows"` (por defecto) o `"columnar"` para obtener un diccionario de
+            listas por columna en lugar de un diccionario por fila.
+        row_type: `"dict"` (por defecto), `"namedtuple"` o `"dataclass"`; tipo de
+            cada fila devuelta. Las variantes sin dict ocupan bastante menos memoria.
+            Las cabeceras que no son identificadores válidos (con espacios,
+            palabras reservadas, repetidas...) pasan a atributos `_<posición>`.
+        columns: Si se indica, sólo se devuelven esas columnas (más `key`, si se usa).
+            Con `polars`, la proyección y el filtro se empujan al lector CSV, de modo
+            que sólo se parsean las columnas necesarias: es la opción recomendada
+            para CSV anchos.
 
     Returns:
         Lista, diccionario o iterador según los parámetros.
@@ -53,44 +168,157 @@ def read_csv_to_dict(
     Raises:
         FileNotFoundError: Si `path` no existe.
         PermissionError: Si no hay permisos para leer el archivo.
-        ValueError: Si el CSV no contiene cabecera.
-        KeyError: Si `key` no está en las cabeceras.
+        ValueError: Si el CSV no contiene cabecera, o si una fila tiene más campos
+            que la cabecera con `row_type` distinto de dict o `layout="columnar"`
+            (en filas dict se guardan bajo la clave None, como en `csv.DictReader`).
+        KeyError: Si `key`, `filter_column` o alguna de `columns` no está en las
+            cabeceras.
         csv.Error: Para errores de parsing del CSV.
     """
 
+    def _check_columns(header: List[str], kname: Optional[str] = None) -> None:
+        # frozenset: pertenencia O(1) en lugar de recorrer la cabecera cada vez
+        present = frozenset(header)
+        if kname is not None and kname not in present:
+            raise KeyError(f"La columna '{kname}' no existe en el CSV")
+        if filter_column is not None and filter_column not in present:
+            raise KeyError(
+                f"La columna de filtro '{filter_column}' no existe en el CSV"
+            )
+        if wanted is not None:
+            missing = [c for c in wanted if c not in present]
+            if missing:
+                raise KeyError(f"Columnas no existentes en el CSV: {missing}")
+
+    def _read_rows(
+        f: Any, kname: Optional[str] = None
+    ) -> Tuple[List[str], Iterator[List[str]]]:
+        # `csv.reader` devuelve listas: el filtro compara por posición y sólo
+        # las filas que lo cumplen llegan a convertirse en dict/objeto.
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            raise ValueError("CSV sin cabecera (fieldnames es None)")
+        _check_columns(header, kname)
+        # filter(None, ...) descarta líneas vacías, como DictReader
+        rows: Iterator[List[str]] = filter(None, reader)
+        if filter_column is not None:
+            pred = _compile_row_filter(header, filter_column, filter_value)
+            rows = filter(pred, rows)
+        if wanted is not None:
+            # la última aparición gana, como en DictReader con cabeceras repetidas
+            positions = {name: i for i, name in enumerate(header)}
+            idx = [positions[c] for c in wanted]
+            width = len(header)
+            rows = ([_pad_row(v, width)[i] for i in idx] for v in rows)
+            header = list(wanted)
+        return header, rows
+
+    def _row_builder(header: List[str]) -> Any:
+        cls = _row_class(header, row_type)
+        if cls is None:
+            return lambda values: _dict_row(header, values)
+        width = len(header)
+        return lambda values: cls(*_fit_row(values, width))
+
     def _iter_rows() -> Iterator[Dict[str, str]]:
-        f = open(path, encoding=encoding, newline="")
-        try:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            if reader.fieldnames is None:
-                raise ValueError("CSV sin cabecera (fieldnames es None)")
-            if filter_column is not None and filter_column not in reader.fieldnames:
-                raise KeyError(
-                    f"La columna de filtro '{filter_column}' no existe en el CSV"
-                )
-            for row in reader:
-                if filter_column is None or row.get(filter_column) == filter_value:
-                    yield row
-        finally:
-            f.close()
+        with open(path, encoding=encoding, newline="") as f:
+            header, rows = _read_rows(f)
+            make = _row_builder(header)
+            for values in rows:
+                yield make(values)
 
     def _iter_keyed(kname: str) -> Iterator[Tuple[str, Dict[str, str]]]:
-        f = open(path, encoding=encoding, newline="")
+        with open(path, encoding=encoding, newline="") as f:
+            header, rows = _read_rows(f, kname)
+            ki = header.index(kname)
+            width = len(header)
+            make = _row_builder(header)
+            for values in rows:
+                values = _pad_row(values, width)
+                yield (values[ki], make(values))
+
+    def _csv_header() -> List[str]:
+        with open(path, encoding=encoding, newline="") as f:
+            header = next(csv.reader(f, delimiter=delimiter), None)
+        if not header:
+            raise ValueError("CSV sin cabecera (fieldnames es None)")
+        return header
+
+    def _polars_frame(kname: Optional[str] = None) -> Optional["pl.DataFrame"]:
+        # Devuelve None si `polars` no puede reproducir lo que daría `csv`: líneas
+        # en blanco, filas con más o menos campos que la cabecera, o cabeceras
+        # repetidas o con BOM (que `polars` renombra o recorta).
+        header = _csv_header()
+        _check_columns(header, kname)
+        last = header[-1]
         try:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            if reader.fieldnames is None:
-                raise ValueError("CSV sin cabecera (fieldnames es None)")
-            if kname not in reader.fieldnames:
-                raise KeyError(f"La columna '{kname}' no existe en el CSV")
-            if filter_column is not None and filter_column not in reader.fieldnames:
-                raise KeyError(
-                    f"La columna de filtro '{filter_column}' no existe en el CSV"
-                )
-            for row in reader:
-                if filter_column is None or row.get(filter_column) == filter_value:
-                    yield (row[kname], row)
-        finally:
-            f.close()
+            if scan_ok:
+                # Evaluación perezosa: el filtro y la proyección (`columns`) se
+                # empujan al lector, que sólo parsea las filas/columnas necesarias.
+                lf = pl.scan_csv(path, separator=delimiter, infer_schema_length=0)
+            else:
+                # infer_schema_length=0 mantiene todas las columnas como texto,
+                # igual que `csv`
+                lf = pl.read_csv(
+                    path, separator=delimiter, encoding=encoding, infer_schema_length=0
+                ).lazy()
+            if lf.collect_schema().names() != header:
+                return None
+            if filter_column is not None:
+                lf = lf.filter(pl.col(filter_column).fill_null("") == filter_value)
+            if wanted is not None:
+                lf = lf.select(wanted if last in wanted else [*wanted, last])
+            df = lf.collect(engine="streaming")
+        except pl.exceptions.PolarsError:
+            return None
+        # `polars` deja a null tanto un campo vacío como uno ausente; una fila
+        # corta o en blanco siempre deja a null la última columna, y en ese caso
+        # no se puede distinguir "" de None.
+        if df[last].null_count():
+            return None
+        if wanted is not None and last not in wanted:
+            df = df.drop(last)
+        return df.fill_null("")
+
+    def _load_polars() -> Union[List[Dict[str, str]], Dict[str, Any], None]:
+        df = _polars_frame(key)
+        if df is None:
+            return None
+
+        if layout == "columnar":
+            return df.to_dict(as_series=False)
+
+        cls = _row_class(df.columns, row_type)
+
+        def _rows(frame: "pl.DataFrame") -> List[Any]:
+            if cls is None:
+                return frame.to_dicts()
+            return [cls(*values) for values in frame.iter_rows()]
+
+        if key is None:
+            return _rows(df)
+
+        if allow_duplicates:
+            return {
+                k: _rows(group) for (k,), group in df.group_by(key, maintain_order=True)
+            }
+
+        duplicated = df.filter(pl.col(key).is_duplicated())
+        if duplicated.height:
+            raise ValueError(
+                f"Valor duplicado '{duplicated[key][0]}' en la columna '{key}'"
+            )
+        return dict(zip(df[key].to_list(), _rows(df)))
+
+    # Columnas a devolver; la clave se incluye siempre para poder indexar
+    wanted: Optional[List[str]] = None
+    if columns is not None:
+        wanted = list(columns)
+        if key is not None and key not in wanted:
+            wanted.append(key)
+    # `scan_csv` sólo admite UTF-8; otras codificaciones usan `pl.read_csv`
+    scan_ok = pl is not None and encoding.lower().replace("-", "") == "utf8"
 
     # Validaciones rápidas de existencia/permisos
     if not os.path.exists(path):
@@ -102,6 +330,14 @@ def read_csv_to_dict(
             raise ValueError(
                 "`filter_column` y `filter_value` deben proporcionarse juntos"
             )
+        if layout not in ("rows", "columnar"):
+            raise ValueError(f"layout desconocido: {layout}")
+        if layout == "columnar" and (key is not None or stream):
+            raise ValueError("layout='columnar' no admite `key` ni `stream`")
+        if row_type not in ROW_TYPES:
+            raise ValueError(f"row_type desconocido: {row_type}")
+        if layout == "columnar" and row_type != "dict":
+            raise ValueError("layout='columnar' no admite `row_type`")
 
         if stream:
             if key is None:
@@ -110,27 +346,30 @@ def read_csv_to_dict(
                 return _iter_keyed(key)
 
         # No streaming: cargar en memoria
+        if pl is not None:
+            result = _load_polars()
+            if result is not None:
+                return result
+
         with open(path, encoding=encoding, newline="") as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            if reader.fieldnames is None:
-                raise ValueError("CSV sin cabecera (fieldnames es None)")
+            header, rows = _read_rows(f, key)
+            width = len(header)
 
             if key is None:
-                # Construir lista aplicando filtro si procede
-                if filter_column is None:
-                    return list(reader)
-                return [r for r in reader if r.get(filter_column) == filter_value]
-
-            if key not in reader.fieldnames:
-                raise KeyError(f"La columna '{key}' no existe en el CSV")
+                if layout == "columnar":
+                    cols = list(zip(*(_fit_row(v, width) for v in rows)))
+                    if not cols:
+                        return {name: [] for name in header}
+                    return {name: list(col) for name, col in zip(header, cols)}
+                return list(map(_row_builder(header), rows))
 
+            ki = header.index(key)
+            make = _row_builder(header)
             result: Dict[str, Any] = {}
-            for row in reader:
-                # Saltar filas que no cumplen el filtro (si se indicó)
-                if filter_column is not None and row.get(filter_column) != filter_value:
-                    continue
-
-                k = row[key]
+            for values in rows:
+                values = _pad_row(values, width)
+                k = values[ki]
+                row = make(values)
                 if allow_duplicates:
                     result.setdefault(k, []).append(row)
                 else:
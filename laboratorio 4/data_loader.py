@@ -24,9 +24,42 @@ import os
 import json
 import csv
 import logging
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from contextlib import ExitStack
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 import xml.etree.ElementTree as ET
 
+try:
+    from lxml import etree as LET
+except ImportError:  # pragma: no cover - dependencia opcional
+    LET = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - dependencia opcional
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dependencia opcional
+    pa = None
+
 _logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
@@ -51,46 +84,112 @@ def _detect_format(filepath: str, fmt: Optional[str] = None) -> str:
     if lower.endswith(".xml"):
         return "xml"
 
+    # Lectura binaria y avance por índice: no se decodifica ni se copia la
+    # cabecera sólo para encontrar el primer carácter significativo.
+    with open(filepath, "rb") as f:
+        head = f.read(2048)
+    i = 0
+    size = len(head)
+    while i < size and head[i] in b" \t\r\n":
+        i += 1
+    if i == size:
+        raise ValueError("Archivo vacío o no legible")
+    first = head[i : i + 1]
+    if first in (b"{", b"["):
+        return "json"
+    if first == b"<":
+        return "xml"
+    return "csv"
+
+
+def _sniff_json(f: BinaryIO) -> Tuple[bytes, bool]:
+    """Inspecciona el comienzo de un JSON abierto en binario y lo rebobina.
+
+    Devuelve el primer carácter significativo y si el contenido parece NDJSON
+    (la primera línea es por sí sola un objeto o array JSON válido y le siguen
+    más líneas). Se leen bloques de 4 KB; sólo se lee la primera línea entera si
+    empieza por `{` y no cabe en el bloque.
+    """
+    head = b""
+    while not head:
+        chunk = f.read(4096)
+        if not chunk:
+            raise ValueError("Archivo JSON vacío")
+        head = chunk.lstrip()
+
+    first, sep, rest = head.partition(b"\n")
+    if not sep and head.startswith(b"{"):
+        first += f.readline()
+        rest = f.read(4096)
+    first = first.strip()
+    is_ndjson = False
+    if first[:1] in (b"{", b"[") and first[-1:] in (b"}", b"]") and rest.strip():
+        # `{"a": {"b": 1}` + `}` en la línea siguiente es un único objeto: la
+        # primera línea tiene que parsear sola
+        try:
+            json.loads(first)
+            is_ndjson = True
+        except ValueError:
+            pass
+    f.seek(0)
+    return head[:1], is_ndjson
+
+
+def _json_parser(fast: bool = False) -> Callable[[bytes], Any]:
+    """Devuelve la función de parseo JSON: `json.loads` u `orjson.loads` con `fast`.
+
+    `orjson` es más rápido pero convierte a float los enteros que no caben en 64
+    bits; por eso es opcional. Si `orjson` rechaza el documento (p.ej. `NaN` o
+    `Infinity`, que sí escribe `json.dumps`) se reintenta con `json.loads`.
+    """
+    if not fast or orjson is None:
+        return json.loads
+
+    def _loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    return _loads
+
+
+def _read_json_full(f: BinaryIO, loads: Callable[[bytes], Any] = json.loads) -> Any:
+    """Carga JSON completo en memoria (tolerante a errores).
+
+    Lee bytes para evitar decodificar a `str`; `loads` es la función de parseo
+    (ver `_json_parser`).
+    """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            head = f.read(2048).lstrip()
-            if not head:
-                raise ValueError("Archivo vacío o no legible")
-            if head[0] in ("{", "["):
-                return "json"
-            if head.startswith("<?xml") or head.startswith("<"):
-                return "xml"
-            return "csv"
-    except FileNotFoundError:
-        raise
-
-
-def _read_json_full(filepath: str) -> Any:
-    """Carga JSON completo en memoria (tolerante a errores)."""
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return loads(f.read())
     except json.JSONDecodeError as e:
         raise ValueError(f"Error parsing JSON: {e}")
 
 
-def _read_json_ndjson(filepath: str) -> Generator[Any, None, None]:
-    """Generador para archivos NDJSON (una entidad JSON por línea)."""
-    with open(filepath, "r", encoding="utf-8") as f:
+def _read_json_ndjson(
+    f: BinaryIO, loads: Callable[[bytes], Any] = json.loads
+) -> Generator[Any, None, None]:
+    """Generador para archivos NDJSON (una entidad JSON por línea).
+
+    Cierra `f` al terminar.
+    """
+    with f:
         for i, line in enumerate(f):
             line = line.strip()
             if not line:
                 continue
             try:
-                yield json.loads(line)
+                yield loads(line)
             except json.JSONDecodeError as e:
                 raise ValueError(f"JSON inválido en línea {i}: {e}")
 
 
-def _read_json_stream_with_ijson(filepath: str) -> Generator[Any, None, None]:
+def _read_json_stream_with_ijson(f: BinaryIO) -> Generator[Any, None, None]:
     """Usa ijson si está disponible para parsear arrays JSON muy grandes.
 
-    Devuelve un generador de elementos (items) de un array JSON superior.
+    Devuelve un generador de elementos (items) de un array JSON superior, que
+    cierra `f` al terminar. La importación se comprueba al llamar (no al iterar)
+    para poder hacer fallback.
     """
     try:
         import ijson  # type: ignore
@@ -99,9 +198,15 @@ def _read_json_stream_with_ijson(filepath: str) -> Generator[Any, None, None]:
             "Instale 'ijson' para parseo JSON en streaming (pip install ijson)"
         )
 
-    with open(filepath, "rb") as f:
-        for item in ijson.items(f, "item"):
-            yield item
+    def _items() -> Generator[Any, None, None]:
+        with f:
+            try:
+                # use_float: floats como en `json`, no `Decimal`
+                yield from ijson.items(f, "item", use_float=True)
+            except ijson.JSONError as e:
+                raise ValueError(f"Error parsing JSON: {e}")
+
+    return _items()
 
 
 def _read_csv_rows(filepath: str) -> Generator[Dict[str, Any], None, None]:
@@ -117,6 +222,229 @@ def _read_csv_rows(filepath: str) -> Generator[Dict[str, Any], None, None]:
         raise ValueError(f"Error leyendo CSV: {e}")
 
 
+def _resolve_index_col(header: List[str], index_col: Union[int, str]) -> int:
+    """Devuelve la posición de `index_col` (posición o nombre) en la cabecera."""
+    if isinstance(index_col, int):
+        if index_col < 0 or index_col >= len(header):
+            raise ValueError("index_col fuera de rango")
+        return index_col
+    try:
+        return header.index(index_col)
+    except ValueError:
+        raise ValueError(f"index_col nombre no encontrado en encabezados: {index_col}")
+
+
+def _csv_keyed_pairs(
+    reader: Any, header: List[str], key_idx: int
+) -> Generator[Tuple[str, Dict[str, Any]], None, None]:
+    """Genera pares `(clave, fila sin la columna clave)` desde un `csv.reader`.
+
+    Cada dict se construye una sola vez por posición, sin crear la fila completa
+    y después copiarla quitando la clave.
+    """
+    other_idx = [i for i in range(len(header)) if i != key_idx]
+    other_names = [header[i] for i in other_idx]
+    width = len(header)
+    for i, row in enumerate(reader):
+        if not row:
+            continue
+        if key_idx >= len(row):
+            raise ValueError(f"Fila {i} sin columna índice '{header[key_idx]}'")
+        key = row[key_idx]
+        if key == "":
+            raise ValueError(f"Fila {i} tiene clave índice vacía")
+        if len(row) < width:
+            # igual que DictReader: columnas ausentes -> None
+            row = row + [None] * (width - len(row))
+        item: Dict[Any, Any] = dict(zip(other_names, [row[j] for j in other_idx]))
+        if len(row) > width:
+            # y campos de más en una lista bajo la clave None
+            item[None] = row[width:]
+        yield key, item
+
+
+def _read_csv_plain(
+    filepath: str, index_col: Optional[Union[int, str]], layout: str
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """Carga un CSV completo con el módulo `csv` (sin dependencias opcionales)."""
+    try:
+        with open(filepath, newline="", encoding="utf-8") as csvfile:
+            if layout == "rows" and index_col is not None:
+                # csv indexado: un único pase posicional, sin construir y
+                # recortar un dict por fila
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
+                if not header:
+                    raise ValueError("CSV sin encabezados detectables")
+                key_idx = _resolve_index_col(header, index_col)
+                return dict(_csv_keyed_pairs(reader, header, key_idx))
+
+            reader = csv.DictReader(csvfile)
+            if reader.fieldnames is None:
+                raise ValueError("CSV sin encabezados detectables")
+            fieldnames = reader.fieldnames
+            rows = list(reader)
+    except csv.Error as e:
+        raise ValueError(f"Error leyendo CSV: {e}")
+    if layout == "columnar":
+        for i, row in enumerate(rows):
+            if None in row:
+                # los campos de más no tienen columna: no se descartan en silencio
+                raise ValueError(f"Fila {i} tiene más campos que la cabecera")
+        return {name: [row[name] for row in rows] for name in fieldnames}
+    return rows
+
+
+def _csv_header(filepath: str, encoding: str = "utf-8") -> List[str]:
+    """Lee sólo la cabecera del CSV con el módulo `csv`."""
+    with open(filepath, newline="", encoding=encoding) as csvfile:
+        header = next(csv.reader(csvfile), None)
+    if not header:
+        raise ValueError("CSV sin encabezados detectables")
+    return header
+
+
+def _read_csv_frame(filepath: str) -> Optional["pl.DataFrame"]:
+    """Carga un CSV completo con `polars` manteniendo todas las columnas como texto.
+
+    Devuelve None si el resultado no sería el mismo que con `csv`: cabeceras
+    repetidas o con BOM (`polars` las renombra o recorta), filas con más campos
+    que la cabecera, o nulls en la última columna. `polars` deja a null tanto un
+    campo vacío como uno ausente, y una fila corta o una línea en blanco siempre
+    dejan a null la última columna; en esos casos se usa el módulo `csv`.
+    """
+    header = _csv_header(filepath)
+    try:
+        df = pl.read_csv(filepath, infer_schema_length=0)
+    except pl.exceptions.PolarsError:
+        return None
+    if df.columns != header or df[header[-1]].null_count():
+        return None
+    return df.fill_null("")
+
+
+def _arrow_string_options(filepath: str) -> "pacsv.ConvertOptions":
+    """Opciones de `pyarrow.csv` para leer todas las columnas como texto."""
+    # pyarrow descarta el BOM al leer la cabecera; aquí se hace lo mismo
+    header = _csv_header(filepath, "utf-8-sig")
+    return pacsv.ConvertOptions(column_types={name: pa.string() for name in header})
+
+
+def _arrow_source(filepath: str, use_mmap: bool = False) -> "pa.NativeFile":
+    """Abre `filepath` para `pyarrow`: mapeado en memoria o con E/S normal.
+
+    Con `mmap` el parser lee directamente de las páginas de la caché del kernel,
+    sin copiarlas antes a un buffer de Python.
+    """
+    if use_mmap:
+        return pa.memory_map(filepath, "r")
+    return pa.OSFile(filepath, "rb")
+
+
+def _read_csv_batches(
+    filepath: str, batch_size: Optional[int] = None, use_mmap: bool = False
+) -> Generator["pa.RecordBatch", None, None]:
+    """Generador de `pyarrow.RecordBatch` leídos en streaming con `pacsv.open_csv`.
+
+    Si `batch_size` se indica, cada lote tiene como mucho ese número de filas
+    (se usan `slice`, sin copias). `read_data` pasa `use_mmap=True` para los
+    archivos grandes; es la única lectura que mapea el archivo en memoria.
+    """
+    options = _arrow_string_options(filepath)
+    try:
+        with _arrow_source(filepath, use_mmap) as source:
+            for batch in pacsv.open_csv(source, convert_options=options):
+                if batch_size is None:
+                    yield batch
+                    continue
+                for offset in range(0, batch.num_rows, batch_size):
+                    yield batch.slice(offset, batch_size)
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Error leyendo CSV: {e}")
+
+
+def _batched(items: Any, size: int) -> Generator[List[Any], None, None]:
+    """Agrupa los elementos de un iterable en listas de `size` elementos."""
+    buf: List[Any] = []
+    for item in items:
+        buf.append(item)
+        if len(buf) == size:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
+
+
+def _parquet_cache_ok(header: List[str]) -> bool:
+    """Indica si una cabecera admite la caché Parquet sin cambiar el resultado.
+
+    Las columnas repetidas no se pueden releer desde Parquet, y los nombres vacíos
+    o con BOM cambian al pasar por `pyarrow`/`polars`.
+    """
+    return (
+        len(set(header)) == len(header)
+        and all(header)
+        and not header[0].startswith("\ufeff")
+    )
+
+
+def _read_csv_table(filepath: str, use_cache: bool = False) -> "pa.Table":
+    """Carga un CSV completo como `pyarrow.Table` (todas las columnas como texto).
+
+    Con `use_cache=True` guarda una copia Parquet junto al CSV
+    (`<archivo>.csv.parquet`) y la reutiliza mientras no sea más antigua que el CSV,
+    salvo que la cabecera no lo permita (ver `_parquet_cache_ok`).
+    """
+    if use_cache and not _parquet_cache_ok(_csv_header(filepath)):
+        _logger.warning("Se ignora cache_parquet: cabecera repetida, vacía o con BOM")
+        use_cache = False
+    cache = filepath + ".parquet"
+    if (
+        use_cache
+        and os.path.exists(cache)
+        and os.path.getmtime(cache) >= os.path.getmtime(filepath)
+    ):
+        return pq.read_table(cache)
+
+    options = _arrow_string_options(filepath)
+    try:
+        with _arrow_source(filepath) as source:
+            table = pacsv.read_csv(source, convert_options=options)
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Error leyendo CSV: {e}")
+
+    if use_cache:
+        try:
+            pq.write_table(table, cache)
+        except OSError as e:
+            _logger.warning("No se pudo escribir la caché Parquet %s: %s", cache, e)
+    return table
+
+
+def _read_csv_cached(filepath: str) -> Optional["pa.Table"]:
+    """`_read_csv_table` con caché Parquet; None si no coincidiría con `csv`.
+
+    `pyarrow` rechaza las filas con más o menos campos que la cabecera; en ese caso
+    (y si la cabecera no admite la caché, ver `_parquet_cache_ok`) no se escribe
+    caché y se lee con `polars`/`csv`.
+    """
+    if not _parquet_cache_ok(_csv_header(filepath)):
+        _logger.warning("Se ignora cache_parquet: cabecera repetida, vacía o con BOM")
+        return None
+    try:
+        return _read_csv_table(filepath, True)
+    except ValueError as e:
+        _logger.warning("Se ignora cache_parquet: %s", e)
+        return None
+
+
+def _xml_item(elem: Any) -> Dict[str, Any]:
+    """Convierte un elemento XML en dict: sub-etiquetas a texto y atributos con `@`."""
+    item = {child.tag: (child.text.strip() if child.text else None) for child in elem}
+    item.update({f"@{k}": v for k, v in elem.attrib.items()})
+    return item
+
+
 def _read_xml_stream(
     filepath: str, item_tag: Optional[str] = None
 ) -> Generator[Dict[str, Any], None, None]:
@@ -125,35 +453,54 @@ def _read_xml_stream(
     - Si `item_tag` se proporciona, yield para cada elemento con ese tag.
     - Si no, asume que los hijos directos del root son los items.
     Se devuelve un diccionario mapeando sub-etiquetas a texto/atributos.
+
+    Con `lxml` instalado se usa su `iterparse` (libxml2, en C), que filtra por tag
+    en el propio parser y permite liberar los elementos ya procesados.
     """
+    if LET is not None:
+        # sin comentarios ni instrucciones de proceso: sólo elementos
+        context = LET.iterparse(
+            filepath,
+            events=("end",),
+            tag=item_tag,
+            remove_comments=True,
+            remove_pis=True,
+        )
+        try:
+            for _, elem in context:
+                if item_tag is None:
+                    parent = elem.getparent()
+                    if parent is None or parent.getparent() is not None:
+                        continue
+                yield _xml_item(elem)
+                # patrón habitual de lxml para mantener acotada la memoria
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except LET.XMLSyntaxError as e:
+            raise ValueError(f"Error parsing XML: {e}")
+        return
+
     try:
-        context = ET.iterparse(filepath, events=("end",))
+        context = ET.iterparse(filepath, events=("start", "end"))
+        # tras cada `end`, `depth` es la profundidad del padre (1 = el root)
+        depth = 0
+        for event, elem in context:
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if item_tag is None:
+                # como con lxml: sólo los hijos directos del root, nunca el root
+                if depth != 1:
+                    continue
+            elif elem.tag != item_tag:
+                continue
+            yield _xml_item(elem)
+            elem.clear()
     except ET.ParseError as e:
         raise ValueError(f"Error parsing XML: {e}")
 
-    for event, elem in context:
-        # decidimos si este elemento debe ser yield
-        tag = elem.tag
-        if item_tag is None:
-            # Si el element tiene elementos hijos, y su padre es root, lo tratamos como item
-            if list(elem):
-                item = {
-                    child.tag: (child.text.strip() if child.text else None)
-                    for child in elem
-                }
-                item.update({f"@{k}": v for k, v in elem.attrib.items()})
-                yield item
-                elem.clear()
-        else:
-            if tag == item_tag:
-                item = {
-                    child.tag: (child.text.strip() if child.text else None)
-                    for child in elem
-                }
-                item.update({f"@{k}": v for k, v in elem.attrib.items()})
-                yield item
-                elem.clear()
-
 
 def read_data(
     filepath: str,
@@ -164,6 +511,11 @@ def read_data(
     stream: bool = False,
     memory_threshold: int = 10_000_000,
     xml_item_tag: Optional[str] = None,
+    layout: str = "rows",
+    as_arrow: bool = False,
+    cache_parquet: bool = False,
+    batch_size: Optional[int] = None,
+    fast_json: bool = False,
 ) -> Dict[str, Any]:
     """
     Lee un archivo `CSV`, `JSON` o `XML` y devuelve un diccionario con la estructura:
@@ -180,8 +532,25 @@ def read_data(
     Parámetros importantes:
     - `stream`: forzar modo streaming. En streaming, `data` será un generador.
     - `memory_threshold`: tamaño en bytes a partir del cual se considera "grande".
+      Con `as_arrow`, los CSV grandes se leen en streaming mapeados en memoria
+      (`mmap`).
     - `xml_item_tag`: tag de elementos XML a iterar; si no se suministra, se asume
       que los hijos directos del root son los items.
+    - `layout`: para CSV, `"rows"` (lista/dict de filas) o `"columnar"`, que devuelve
+      `{columna: [valores...]}` cargando el archivo en memoria (ignora `index_col`).
+      Como en `csv.DictReader`, los campos de más de una fila van a una lista bajo
+      la clave None; con `layout="columnar"` o `as_arrow` se lanza ValueError.
+    - `as_arrow`: para CSV, devuelve directamente la `pyarrow.Table` (requiere
+      `pyarrow`, ignora `index_col` y `layout`). En streaming, `data` es un
+      generador de `pyarrow.RecordBatch`.
+    - `cache_parquet`: para CSV sin streaming, guarda/reutiliza una copia Parquet junto
+      al archivo para que las lecturas siguientes no vuelvan a parsear el CSV.
+    - `batch_size`: en streaming, agrupa los elementos en listas de `batch_size`
+      (o limita el tamaño de los `RecordBatch` con `as_arrow`). Para volver a
+      iterar fila a fila: `itertools.chain.from_iterable(data)`.
+    - `fast_json`: parsea JSON/NDJSON con `orjson` si está instalado. Es más rápido,
+      pero los enteros de más de 64 bits se devuelven como float; sin él se usa
+      `json` y los datos son exactamente los del archivo.
 
     Compatibilidad con parámetros anteriores: `index_col` sigue funcionando para CSV.
     """
@@ -189,9 +558,24 @@ def read_data(
     if not os.path.exists(filepath):
         raise FileNotFoundError(filepath)
 
+    if layout not in ("rows", "columnar"):
+        raise ValueError(f"layout desconocido: {layout}")
+    if layout == "columnar" and stream:
+        raise ValueError("layout='columnar' no es compatible con stream=True")
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size debe ser >= 1")
+    if (as_arrow or cache_parquet) and pa is None:
+        if as_arrow:
+            raise RuntimeError(
+                "Instale 'pyarrow' para usar as_arrow (pip install pyarrow)"
+            )
+        _logger.warning("pyarrow no disponible; se ignora cache_parquet")
+        cache_parquet = False
+
     fmt_candidate = _detect_format(filepath, fmt)
     filesize = os.path.getsize(filepath)
-    should_stream = stream or (filesize >= memory_threshold)
+    is_large = filesize >= memory_threshold
+    should_stream = stream or is_large
 
     _logger.debug(
         "read_data: %s (fmt=%s, size=%d, stream=%s)",
@@ -201,44 +585,40 @@ def read_data(
         should_stream,
     )
 
+    def _stream_output(gen: Any) -> Any:
+        return _batched(gen, batch_size) if batch_size is not None else gen
+
     # JSON handling
     if fmt_candidate == "json":
-        # Detect NDJSON by peeking at first non-empty line
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                first_line = stripped
-                break
-            else:
-                raise ValueError("Archivo JSON vacío")
-
-        # NDJSON (one JSON object per line)
-        if (
-            first_line.startswith("{")
-            or first_line.startswith("[")
-            and "}\n" not in first_line
-        ):
-            # Could be NDJSON or regular JSON; prefer NDJSON if streaming
+        # Un único open: se inspecciona el comienzo y se reutiliza el mismo handle
+        with ExitStack() as stack:
+            f = stack.enter_context(open(filepath, "rb"))
+            first_char, is_ndjson = _sniff_json(f)
+            loads = _json_parser(fast_json)
+
             if should_stream:
-                # Try NDJSON streaming
-                data_gen = _read_json_ndjson(filepath)
-                return {"format": "json", "data": data_gen}
-            # otherwise fallthrough to full load
+                # NDJSON (one JSON object or array per line)
+                if is_ndjson:
+                    data_gen = _read_json_ndjson(f, loads)
+                    stack.pop_all()  # el generador cierra el archivo
+                    return {"format": "json", "data": _stream_output(data_gen)}
+                # Array JSON grande: ijson si está instalado
+                if first_char == b"[":
+                    try:
+                        data_gen = _read_json_stream_with_ijson(f)
+                        stack.pop_all()
+                        return {"format": "json", "data": _stream_output(data_gen)}
+                    except RuntimeError as e:
+                        _logger.warning(
+                            "ijson no disponible: %s; cargando en memoria", e
+                        )
+
+            # Carga completa en memoria
+            if is_ndjson:
+                data = list(_read_json_ndjson(f, loads))
+            else:
+                data = _read_json_full(f, loads)
 
-        # If file is large and user asked streaming, try ijson
-        if should_stream:
-            try:
-                data_gen = _read_json_stream_with_ijson(filepath)
-                return {"format": "json", "data": data_gen}
-            except RuntimeError as e:
-                _logger.warning(
-                    "ijson no disponible: %s; cargando en memoria como fallback", e
-                )
-
-        # Fallback: carga completa en memoria
-        data = _read_json_full(filepath)
         # Validación opcional
         if required_fields:
             if isinstance(data, dict):
@@ -257,86 +637,90 @@ def read_data(
                             f"Campos faltantes en JSON (fila {i}): {missing}"
                         )
 
+        if should_stream:
+            # Objeto en la raíz (o array sin ijson): ya está en memoria, pero en
+            # streaming `data` sigue siendo un generador de elementos
+            items = data if isinstance(data, list) else [data]
+            return {"format": "json", "data": _stream_output(x for x in items)}
+
         return {"format": "json", "data": data}
 
     # CSV handling
     if fmt_candidate == "csv":
-        if should_stream:
-            rows_gen = _read_csv_rows(filepath)
+        if should_stream and as_arrow:
+            batches = _read_csv_batches(filepath, batch_size, is_large)
+            return {"format": "csv", "data": batches}
+
+        if should_stream and layout == "rows":
             if index_col is None:
-                return {"format": "csv", "data": rows_gen}
+                rows_gen = _read_csv_rows(filepath)
+                return {"format": "csv", "data": _stream_output(rows_gen)}
 
-            # need to wrap generator to produce keyed pairs
+            # need to wrap rows to produce keyed pairs; one open, positional access
             def keyed_gen() -> Generator[Tuple[str, Dict[str, Any]], None, None]:
-                # peek fieldnames by creating a reader quickly
-                with open(filepath, newline="", encoding="utf-8") as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    if reader.fieldnames is None:
-                        raise ValueError("CSV sin encabezados detectables")
-                    key_name = None
-                    if isinstance(index_col, int):
-                        if index_col < 0 or index_col >= len(reader.fieldnames):
-                            raise ValueError("index_col fuera de rango")
-                        key_name = reader.fieldnames[index_col]
-                    else:
-                        key_name = index_col
-                        if key_name not in reader.fieldnames:
-                            raise ValueError(
-                                f"index_col nombre no encontrado en encabezados: {key_name}"
-                            )
-
-                for row in _read_csv_rows(filepath):
-                    if key_name not in row:
-                        raise ValueError(f"Fila sin columna índice '{key_name}'")
-                    key = row[key_name]
-                    if key == "":
-                        raise ValueError("Clave índice vacía en CSV")
-                    row_copy = {k: v for k, v in row.items() if k != key_name}
-                    yield key, row_copy
-
-            return {"format": "csv", "data": keyed_gen()}
-
-        # Non-streaming: load all
-        try:
-            with open(filepath, newline="", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-                if reader.fieldnames is None:
-                    raise ValueError("CSV sin encabezados detectables")
-                rows = list(reader)
-        except csv.Error as e:
-            raise ValueError(f"Error leyendo CSV: {e}")
+                try:
+                    with open(filepath, newline="", encoding="utf-8") as csvfile:
+                        reader = csv.reader(csvfile)
+                        header = next(reader, None)
+                        if not header:
+                            raise ValueError("CSV sin encabezados detectables")
+                        key_idx = _resolve_index_col(header, index_col)
+                        yield from _csv_keyed_pairs(reader, header, key_idx)
+                except csv.Error as e:
+                    raise ValueError(f"Error leyendo CSV: {e}")
+
+            return {"format": "csv", "data": _stream_output(keyed_gen())}
+
+        # Non-streaming: load all (pyarrow si se pide Arrow/caché Parquet, polars si
+        # está instalado, `csv` como fallback y siempre que polars/pyarrow no
+        # darían el mismo resultado)
+        if as_arrow:
+            table = _read_csv_table(filepath, cache_parquet)
+            return {"format": "csv", "data": table}
+        df = None
+        table = None
+        if cache_parquet:
+            table = _read_csv_cached(filepath)
+            if table is not None and pl is not None:
+                df = pl.from_arrow(table)
+                table = None
+        elif pl is not None:
+            df = _read_csv_frame(filepath)
+
+        if df is None and table is None:
+            data = _read_csv_plain(filepath, index_col, layout)
+            return {"format": "csv", "data": data}
+
+        # A partir de aquí los datos están en un DataFrame de polars o en una
+        # pyarrow.Table (pyarrow sin polars); ambos son columnares.
+        if layout == "columnar":
+            if df is not None:
+                columns = df.to_dict(as_series=False)
+            else:
+                columns = table.to_pydict()
+            return {"format": "csv", "data": columns}
 
         if index_col is None:
+            rows = df.to_dicts() if df is not None else table.to_pylist()
             return {"format": "csv", "data": rows}
 
-        if isinstance(index_col, int):
-            if index_col < 0 or index_col >= len(reader.fieldnames):
-                raise ValueError("index_col fuera de rango")
-            key_name = reader.fieldnames[index_col]
+        fieldnames = df.columns if df is not None else table.column_names
+        key_name = fieldnames[_resolve_index_col(fieldnames, index_col)]
+        if df is not None:
+            keys = df[key_name].to_list()
+            others = df.drop(key_name).to_dicts()
         else:
-            key_name = index_col
-            if key_name not in reader.fieldnames:
-                raise ValueError(
-                    f"index_col nombre no encontrado en encabezados: {key_name}"
-                )
-
-        result: Dict[str, Dict[str, Any]] = {}
-        for i, row in enumerate(rows):
-            if key_name not in row:
-                raise ValueError(f"Fila {i} sin columna índice '{key_name}'")
-            key = row[key_name]
-            if key == "":
-                raise ValueError(f"Fila {i} tiene clave índice vacía")
-            row_copy = {k: v for k, v in row.items() if k != key_name}
-            result[key] = row_copy
-
-        return {"format": "csv", "data": result}
+            keys = table.column(key_name).to_pylist()
+            others = table.drop([key_name]).to_pylist()
+        if "" in keys:
+            raise ValueError(f"Fila {keys.index('')} tiene clave índice vacía")
+        return {"format": "csv", "data": dict(zip(keys, others))}
 
     # XML handling
     if fmt_candidate == "xml":
         if should_stream:
             gen = _read_xml_stream(filepath, xml_item_tag)
-            return {"format": "xml", "data": gen}
+            return {"format": "xml", "data": _stream_output(gen)}
         # Non-streaming: parse whole tree
         try:
             tree = ET.parse(filepath)
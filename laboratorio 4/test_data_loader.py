@@ -0,0 +1,275 @@
+import io
+import os
+import sys
+import pytest
+
+HERE = os.path.dirname(__file__)
+# allow importing `data_loader.py` in the same folder
+sys.path.insert(0, HERE)
+
+import data_loader  # noqa: E402
+from data_loader import _sniff_json, read_data  # noqa: E402
+
+RAGGED = "id,name,age\n1,A,30\n\n2,B\n3,,\n"
+
+
+def test_read_csv_sample():
+    res = read_data(os.path.join(HERE, "sample.csv"))
+    assert res["format"] == "csv"
+    assert res["data"]["1"] == {"name": "Ana", "score": "95"}
+
+
+def test_csv_blank_line_keyed(tmp_path):
+    p = tmp_path / "blank.csv"
+    p.write_text("id,name\n1,A\n\n2,B\n")
+    res = read_data(str(p), index_col=0)
+    assert res["data"] == {"1": {"name": "A"}, "2": {"name": "B"}}
+
+
+def test_csv_blank_and_short_rows(tmp_path):
+    p = tmp_path / "ragged.csv"
+    p.write_text(RAGGED)
+    expected = [
+        {"id": "1", "name": "A", "age": "30"},
+        {"id": "2", "name": "B", "age": None},
+        {"id": "3", "name": "", "age": ""},
+    ]
+    assert read_data(str(p), index_col=None)["data"] == expected
+    streamed = read_data(str(p), index_col=None, stream=True)["data"]
+    assert list(streamed) == expected
+    columnar = read_data(str(p), layout="columnar")["data"]
+    assert columnar["age"] == ["30", None, ""]
+
+
+def test_csv_cache_parquet_skips_ragged_files(tmp_path):
+    pytest.importorskip("pyarrow")
+    p = tmp_path / "ragged.csv"
+    p.write_text(RAGGED)
+    res = read_data(str(p), index_col=None, cache_parquet=True)
+    assert res["data"] == read_data(str(p), index_col=None)["data"]
+    assert not os.path.exists(str(p) + ".parquet")
+
+
+def test_json_rows_match_source(tmp_path):
+    p = tmp_path / "rows.json"
+    p.write_text('[{"id": 1, "meta": {"a": 1}}, {"id": 2.5, "meta": {"b": 2}}]')
+    res = read_data(str(p))
+    assert res["data"] == [{"id": 1, "meta": {"a": 1}}, {"id": 2.5, "meta": {"b": 2}}]
+    assert isinstance(res["data"][0]["id"], int)
+
+
+def test_json_required_fields_checked_per_row(tmp_path):
+    p = tmp_path / "rows.ndjson"
+    p.write_text('{"id": 1, "name": "A"}\n{"id": 2}\n')
+    with pytest.raises(ValueError, match="fila 1"):
+        read_data(str(p), fmt="json", required_fields=["id", "name"])
+    assert read_data(str(p), fmt="json")["data"][1] == {"id": 2}
+
+
+def test_xml_stream_skips_comments_and_root(tmp_path):
+    p = tmp_path / "people.xml"
+    p.write_text(
+        "<?xml version='1.0'?>\n<people><!-- c --><?pi x?>"
+        "<person id='1'><name>Ana</name><!-- n --></person>"
+        "<person id='2'><name>Beto</name></person></people>"
+    )
+    expected = [{"name": "Ana", "@id": "1"}, {"name": "Beto", "@id": "2"}]
+    assert list(read_data(str(p), stream=True)["data"]) == expected
+    assert read_data(str(p))["data"] == expected
+    tagged = read_data(str(p), stream=True, xml_item_tag="name")["data"]
+    assert len(list(tagged)) == 2
+
+
+def test_json_stream_top_level_object(tmp_path):
+    p = tmp_path / "obj.json"
+    p.write_text('{"id": 1, "name": "A"}')
+    data = read_data(str(p), stream=True)["data"]
+    assert not isinstance(data, dict)
+    assert list(data) == [{"id": 1, "name": "A"}]
+    batched = read_data(str(p), stream=True, batch_size=5)["data"]
+    assert list(batched) == [[{"id": 1, "name": "A"}]]
+
+
+def test_csv_long_rows_match_dictreader(tmp_path):
+    p = tmp_path / "long.csv"
+    p.write_text("id,name\n1,A,x\n2,B\n")
+    rows = read_data(str(p), index_col=None)["data"]
+    assert rows[0] == {"id": "1", "name": "A", None: ["x"]}
+    assert list(read_data(str(p), index_col=None, stream=True)["data"]) == rows
+    keyed = read_data(str(p), index_col=0)["data"]
+    assert keyed == {"1": {"name": "A", None: ["x"]}, "2": {"name": "B"}}
+    assert dict(read_data(str(p), stream=True)["data"]) == keyed
+    with pytest.raises(ValueError):
+        read_data(str(p), layout="columnar")
+
+
+def test_csv_as_arrow():
+    pytest.importorskip("pyarrow")
+    table = read_data(os.path.join(HERE, "sample.csv"), as_arrow=True)["data"]
+    assert table.column_names == ["id", "name", "score"]
+    # todas las columnas como texto, igual que `csv`
+    assert table.column("score").to_pylist() == ["95", "82"]
+
+
+def test_csv_as_arrow_rejects_ragged_rows(tmp_path):
+    pytest.importorskip("pyarrow")
+    p = tmp_path / "long.csv"
+    p.write_text("id,name\n1,A,x\n")
+    with pytest.raises(ValueError):
+        read_data(str(p), as_arrow=True)
+
+
+def test_csv_arrow_batch_size(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    p = tmp_path / "rows.csv"
+    p.write_text("id,name\n" + "".join(f"{i},n{i}\n" for i in range(5)))
+    batches = list(read_data(str(p), stream=True, as_arrow=True, batch_size=2)["data"])
+    assert all(isinstance(b, pa.RecordBatch) for b in batches)
+    assert [b.num_rows for b in batches] == [2, 2, 1]
+    assert batches[2].column(0).to_pylist() == ["4"]
+
+
+def test_csv_cache_parquet_staleness(tmp_path):
+    pytest.importorskip("pyarrow")
+    p = tmp_path / "data.csv"
+    cache = str(p) + ".parquet"
+    p.write_text("id,name\n1,A\n")
+    assert read_data(str(p), cache_parquet=True)["data"] == {"1": {"name": "A"}}
+    assert os.path.exists(cache)
+
+    # caché al día: se reutiliza sin reescribirla
+    written = os.path.getmtime(cache)
+    assert read_data(str(p), cache_parquet=True)["data"] == {"1": {"name": "A"}}
+    assert os.path.getmtime(cache) == written
+
+    # CSV más reciente que la caché: se vuelve a parsear
+    p.write_text("id,name\n1,B\n")
+    os.utime(p, (written + 10, written + 10))
+    assert read_data(str(p), cache_parquet=True)["data"] == {"1": {"name": "B"}}
+
+
+def _track_open(monkeypatch):
+    opened = []
+    real_open = open
+
+    def _open(*args, **kwargs):
+        f = real_open(*args, **kwargs)
+        opened.append(f)
+        return f
+
+    monkeypatch.setattr(data_loader, "open", _open, raising=False)
+    return opened
+
+
+def test_ndjson_stream_closes_file(tmp_path, monkeypatch):
+    p = tmp_path / "rows.ndjson"
+    p.write_text('{"id": 1}\n{"id": 2}\n')
+    opened = _track_open(monkeypatch)
+    data = read_data(str(p), fmt="json", stream=True)["data"]
+    assert not opened[-1].closed  # el generador es dueño del archivo
+    assert list(data) == [{"id": 1}, {"id": 2}]
+    assert all(f.closed for f in opened)
+
+
+def test_ijson_stream_closes_file(tmp_path, monkeypatch):
+    pytest.importorskip("ijson")
+    p = tmp_path / "rows.json"
+    p.write_text('[{"id": 1}, {"id": 2}]')
+    opened = _track_open(monkeypatch)
+    data = read_data(str(p), stream=True)["data"]
+    assert not opened[-1].closed
+    assert [item["id"] for item in data] == [1, 2]
+    assert all(f.closed for f in opened)
+
+
+@pytest.mark.parametrize(
+    "content, first, is_ndjson",
+    [
+        (b'{"a": 1}\n{"a": 2}\n', b"{", True),
+        (b'{"a": 1}\n', b"{", False),
+        (b'{\n  "a": 1\n}\n', b"{", False),
+        (b'{"a": {"b": 1}\n}\n', b"{", False),
+        (b"[1, 2]\n[3, 4]\n", b"[", True),
+        (b' \n[{"a": 1},\n{"a": 2}]', b"[", False),
+        # primera línea más larga que el bloque de 4 KB
+        (b'{"a": "' + b"x" * 5000 + b'"}\n{"a": 2}\n', b"{", True),
+        # espacio inicial más largo que el bloque de 4 KB
+        (b" " * 5000 + b'{"a": 1}\n{"a": 2}\n', b"{", True),
+    ],
+)
+def test_sniff_json(content, first, is_ndjson):
+    f = io.BytesIO(content)
+    assert _sniff_json(f) == (first, is_ndjson)
+    assert f.tell() == 0
+
+
+def test_sniff_json_empty():
+    with pytest.raises(ValueError):
+        _sniff_json(io.BytesIO(b"  \n"))
+
+
+def test_json_keeps_big_ints_and_nan(tmp_path):
+    p = tmp_path / "values.json"
+    p.write_text('{"big": 1180591620717411303424, "nan": NaN, "inf": Infinity}')
+    data = read_data(str(p))["data"]
+    assert data["big"] == 2**70 and isinstance(data["big"], int)
+    assert data["nan"] != data["nan"] and data["inf"] == float("inf")
+    # orjson rechaza NaN/Infinity: se reintenta con `json`
+    fast = read_data(str(p), fast_json=True)["data"]
+    assert fast["inf"] == float("inf")
+
+
+def test_ndjson_keeps_big_ints(tmp_path):
+    p = tmp_path / "rows.ndjson"
+    p.write_text('{"id": 18446744073709551616}\n{"id": NaN}\n')
+    rows = read_data(str(p), fmt="json")["data"]
+    assert rows[0]["id"] == 2**64
+    assert rows[1]["id"] != rows[1]["id"]
+
+
+def test_json_object_split_over_lines(tmp_path):
+    p = tmp_path / "obj.json"
+    p.write_text('{"a": {"b": 1}\n}\n')
+    assert read_data(str(p))["data"] == {"a": {"b": 1}}
+    assert list(read_data(str(p), stream=True)["data"]) == [{"a": {"b": 1}}]
+
+
+def test_ndjson_array_lines_stream(tmp_path):
+    p = tmp_path / "rows.ndjson"
+    p.write_text("[1, 2]\n[3, 4]\n")
+    assert list(read_data(str(p), fmt="json", stream=True)["data"]) == [[1, 2], [3, 4]]
+
+
+def test_ijson_stream_floats_and_errors(tmp_path):
+    pytest.importorskip("ijson")
+    p = tmp_path / "rows.json"
+    p.write_text('[{"a": 1.5}, {"a": 2}]')
+    rows = list(read_data(str(p), stream=True)["data"])
+    assert rows == [{"a": 1.5}, {"a": 2}]
+    assert type(rows[0]["a"]) is float
+    p.write_text('[{"a": 1.5}, {"a": ')
+    with pytest.raises(ValueError):
+        list(read_data(str(p), stream=True)["data"])
+
+
+@pytest.mark.parametrize("header", ["id,id,x", "id,,x", "\ufeffid,name,x"])
+def test_csv_cache_parquet_skips_unsafe_headers(tmp_path, header):
+    pytest.importorskip("pyarrow")
+    p = tmp_path / "h.csv"
+    p.write_text(header + "\n1,2,3\n", encoding="utf-8")
+    expected = read_data(str(p), index_col=None)["data"]
+    for _ in range(2):
+        res = read_data(str(p), index_col=None, cache_parquet=True)
+        assert res["data"] == expected
+        table = read_data(str(p), as_arrow=True, cache_parquet=True)["data"]
+        assert table.num_rows == 1
+    assert not os.path.exists(str(p) + ".parquet")
+
+
+def test_csv_large_as_arrow_streams_mapped_batches(tmp_path):
+    pytest.importorskip("pyarrow")
+    p = tmp_path / "rows.csv"
+    p.write_text("id,name\n1,A\n2,B\n")
+    # por encima de memory_threshold: streaming de RecordBatch con mmap
+    data = read_data(str(p), as_arrow=True, memory_threshold=1)["data"]
+    assert [row["name"] for b in data for row in b.to_pylist()] == ["A", "B"]
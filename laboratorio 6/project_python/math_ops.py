@@ -1,20 +1,23 @@
-from functools import lru_cache
+import math
 
 def factorial(n: int) -> int:
     """Calcula el factorial de un número entero no negativo."""
     if n < 0:
         raise ValueError("El factorial no está definido para números negativos")
-    if n == 0 or n == 1:
-        return 1
-    return n * factorial(n - 1)
+    return math.factorial(n)
 
 
-@lru_cache(maxsize=None)
 def fibonacci(n: int) -> int:
-    """Calcula el n-ésimo número de Fibonacci."""
+    """Calcula el n-ésimo número de Fibonacci.
+
+    Usa la duplicación rápida (F(2k) = F(k)·[2F(k+1) − F(k)],
+    F(2k+1) = F(k)² + F(k+1)²), con O(log n) multiplicaciones y sin recursión.
+    """
     if n <= 0:
         return 0
-    elif n == 1:
-        return 1
-    else:
-        return fibonacci(n - 1) + fibonacci(n - 2)
+    a, b = 0, 1  # F(k), F(k+1) con k = 0
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a
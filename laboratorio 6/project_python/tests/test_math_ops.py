@@ -27,3 +27,12 @@ def test_fibonacci_memoized_consistency():
     a = math_ops.fibonacci(20)
     b = math_ops.fibonacci(20)
     assert a == b
+
+def test_factorial_large_no_recursion_error():
+    assert math_ops.factorial(3000) == math_ops.factorial(2999) * 3000
+
+def test_fibonacci_large_matches_iterative():
+    a, b = 0, 1
+    for _ in range(1000):
+        a, b = b, a + b
+    assert math_ops.fibonacci(1000) == a